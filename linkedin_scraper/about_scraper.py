@@ -7,23 +7,84 @@ structured information such as company name, overview, website, industry, etc.
 """
 
 import os
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Any
+import json
+import soupsieve as sv
+from .parsing import make_soup, read_html_file
+from typing import Dict, List, Optional, Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Selectors for the company name and overview. LinkedIn's HTML structure
+# varies, so several candidates are combined into one selector per field
+# and the document is walked once for each.
+_NAME_SELECTOR_LIST = (
+    'h1.org-top-card-summary__title',
+    'h1.ember-view.t-24.t-black.t-bold',
+    'h1.text-heading-xlarge.inline.t-24.v-align-middle.break-words',
+)
+_NAME_SELECTOR = sv.compile(', '.join(_NAME_SELECTOR_LIST))
+# Individual name matchers, in order of preference
+_NAME_MATCHERS = [sv.compile(selector) for selector in _NAME_SELECTOR_LIST]
+
+_OVERVIEW_SELECTOR_LIST = (
+    'p.break-words.white-space-pre-wrap',
+    'div.org-about-us-organization-description__text',
+    'div.org-about-module__description',
+    'div.org-about-module__text',
+    'div.org-page-details__description-content',
+)
+_OVERVIEW_SELECTOR = sv.compile(', '.join(_OVERVIEW_SELECTOR_LIST))
+# Individual overview matchers, in order of preference
+_OVERVIEW_MATCHERS = [sv.compile(selector) for selector in _OVERVIEW_SELECTOR_LIST]
+
+# Fewer about files than this are parsed in-process, without worker processes
+_MIN_FILES_FOR_PROCESSES = 4
 
+# Labels and values of the company details definition lists
+_DEFINITION_SELECTOR = sv.compile('dl dt, dl dd')
 
-def extract_company_info(html_content: str) -> Dict[str, Any]:
+# Keywords found in definition list labels, mapped to the field they fill.
+# Checked in order; the first keyword contained in a label wins.
+_FIELD_MAP = {
+    'website': 'website',
+    'industry': 'industry',
+    'company size': 'company_size',
+    'employees': 'company_size',
+    'headquarters': 'headquarters',
+    'location': 'headquarters',
+    'founded': 'founded',
+    'specialties': 'specialties',
+    'verified': 'verified_date',
+}
+
+# Fallback when there are no definition lists: labelled about/details
+# sections, and the element holding each section's value
+_DETAIL_SECTION_SELECTOR = sv.compile(
+    'section[class*="org-about-module"], section[class*="org-page-details"], '
+    'div[class*="org-about-module"], div[class*="org-page-details"]'
+)
+_DETAIL_VALUE_SELECTOR = sv.compile(
+    'p[class*="description"], p[class*="text"], div[class*="description"], div[class*="text"]'
+)
+
+
+def extract_company_info(html_content: Union[str, bytes]) -> Dict[str, Any]:
     """
     Extract company information from HTML content.
     
     Args:
-        html_content: The HTML content of a company's about page
+        html_content: The HTML content of a company's about page, as str or UTF-8 bytes
         
     Returns:
         A dictionary containing the extracted company information
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_soup(html_content)
     
     # Initialize result dictionary
     company_info = {
@@ -38,75 +99,65 @@ def extract_company_info(html_content: str) -> Dict[str, Any]:
         'verified_date': ''
     }
     
+    # Set once any field has been filled in
+    hit = False
+    
     try:
-        # Extract company name
-        # Try different selectors for company name as LinkedIn's HTML structure varies
-        name_selectors = [
-            'h1.org-top-card-summary__title',
-            'h1.org-top-card-summary__title.t-24.t-black.t-bold',
-            'h1.ember-view.t-24.t-black.t-bold',
-            'h1.text-heading-xlarge.inline.t-24.v-align-middle.break-words'
-        ]
-        
-        for selector in name_selectors:
-            name_tag = soup.select_one(selector)
+        # Extract company name - collect every candidate in one pass, then
+        # use the first tag matched by the most preferred selector
+        name_candidates = _NAME_SELECTOR.select(soup)
+        for matcher in _NAME_MATCHERS:
+            name_tag = next((tag for tag in name_candidates if matcher.match(tag)), None)
             if name_tag:
                 company_info['name'] = name_tag.get_text(strip=True)
+                hit = bool(company_info['name'])
                 break
         
-        # Extract overview - try different selectors
-        overview_selectors = [
-            'p.break-words.white-space-pre-wrap',
-            'div.org-about-us-organization-description__text',
-            'div.org-about-module__description',
-            'div.org-about-module__text',
-            'div.org-page-details__description-content'
-        ]
-        
-        for selector in overview_selectors:
-            overview_tags = soup.select(selector)
+        # Extract overview - collect every candidate in one pass, then use
+        # the tags matched by the most preferred selector
+        overview_candidates = _OVERVIEW_SELECTOR.select(soup)
+        for matcher in _OVERVIEW_MATCHERS:
+            overview_tags = [tag for tag in overview_candidates if matcher.match(tag)]
             if overview_tags:
-                overview_text = '\n'.join([tag.get_text('\n', strip=True) for tag in overview_tags])
+                # Usually a single tag matches, so skip the join in that case
+                if len(overview_tags) == 1:
+                    overview_text = overview_tags[0].get_text('\n', strip=True)
+                else:
+                    overview_text = '\n'.join(tag.get_text('\n', strip=True) for tag in overview_tags)
                 if overview_text:
                     company_info['overview'] = overview_text
+                    hit = True
                     break
         
-        # Extract details from definition list
-        dl_elements = soup.find_all('dl')
-        for dl in dl_elements:
-            dt_elements = dl.find_all('dt')
-            dd_elements = dl.find_all('dd')
-            
+        # Extract details from definition lists - collect every <dt> and <dd>
+        # in one pass, grouped by the list they belong to
+        definition_lists = {}
+        for tag in _DEFINITION_SELECTOR.select(soup):
+            dt_elements, dd_elements = definition_lists.setdefault(id(tag.find_parent('dl')), ([], []))
+            (dt_elements if tag.name == 'dt' else dd_elements).append(tag)
+        
+        for dt_elements, dd_elements in definition_lists.values():
             for dt, dd in zip(dt_elements, dd_elements):
                 label = dt.get_text(strip=True).lower()
                 value = dd.get_text('\n', strip=True)
                 
                 # Map labels to the correct fields
-                if 'website' in label:
-                    company_info['website'] = value
-                elif 'industry' in label:
-                    company_info['industry'] = value
-                elif 'company size' in label or 'employees' in label:
-                    company_info['company_size'] = value
-                elif 'headquarters' in label or 'location' in label:
-                    company_info['headquarters'] = value
-                elif 'founded' in label or 'year founded' in label:
-                    company_info['founded'] = value
-                elif 'specialties' in label:
-                    company_info['specialties'] = value
-                elif 'verified' in label:
-                    company_info['verified_date'] = value
+                for keyword, field in _FIELD_MAP.items():
+                    if keyword in label:
+                        company_info[field] = value
+                        hit = hit or bool(value)
+                        break
         
         # If we couldn't find the information in definition lists, try other approaches
-        if not any(company_info.values()):
+        if not hit:
             # Try to find information in sections with labels
-            sections = soup.find_all(['section', 'div'], class_=lambda c: c and ('org-about-module' in c or 'org-page-details' in c))
+            sections = _DETAIL_SECTION_SELECTOR.select(soup)
             for section in sections:
                 # Look for labeled sections
                 heading = section.find(['h2', 'h3'])
                 if heading:
                     label = heading.get_text(strip=True).lower()
-                    content_div = section.find(['p', 'div'], class_=lambda c: c and ('description' in c or 'text' in c))
+                    content_div = _DETAIL_VALUE_SELECTOR.select_one(section)
                     if content_div:
                         value = content_div.get_text('\n', strip=True)
                         
@@ -142,19 +193,20 @@ def process_about_file(file_path_or_content) -> Dict[str, Any]:
         Dictionary containing the extracted company information
     """
     try:
-        # Check if input is a file path or HTML content
-        if isinstance(file_path_or_content, (str, Path)) and os.path.exists(str(file_path_or_content)):
-            # It's a file path
-            with open(file_path_or_content, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            source_name = os.path.basename(str(file_path_or_content))
-        else:
-            # It's HTML content
-            html_content = file_path_or_content
-            source_name = "in_memory_content"
+        # Check if input is a file path or HTML content by trying to read it
+        html_content = file_path_or_content
+        source_name = "in_memory_content"
+        if isinstance(file_path_or_content, (str, Path)):
+            try:
+                # It's a file path
+                html_content = read_html_file(file_path_or_content)
+                source_name = os.path.basename(file_path_or_content)
+            except (OSError, ValueError):
+                # It's HTML content (too long, or otherwise not a readable path)
+                pass
         
         # Make sure we have valid HTML content
-        if not html_content or not isinstance(html_content, str):
+        if not html_content or not isinstance(html_content, (str, bytes)):
             print(f"Invalid HTML content provided: {type(html_content)}")
             return None
         
@@ -191,20 +243,41 @@ def process_all_about_files(directory: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing company information
     """
-    about_dir = Path(directory)
-    about_files = list(about_dir.glob('*_about.txt'))
+    # A fixed suffix test on scandir entries avoids glob's pattern matching
+    with os.scandir(directory) as entries:
+        about_files = [
+            entry.path for entry in entries
+            if entry.name.endswith('_about.txt') and entry.is_file()
+        ]
     
     all_companies = []
     
-    for file_path in about_files:
-        print(f"Processing {file_path.name}...")
-        company_info = process_about_file(file_path)
-        if company_info:
-            all_companies.append(company_info)
+    # Files are parsed independently, so spread them across worker processes,
+    # but never start more workers than there are files
+    workers = min(os.cpu_count() or 1, len(about_files))
+    
+    if len(about_files) < _MIN_FILES_FOR_PROCESSES or workers < 2:
+        # Starting worker processes costs more than parsing a few files
+        results = map(process_about_file, about_files)
+        _collect_companies(about_files, results, all_companies)
+    else:
+        # Batch several files per task, but keep every worker busy for small directories
+        chunksize = max(1, min(8, len(about_files) // workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(process_about_file, about_files, chunksize=chunksize)
+            _collect_companies(about_files, results, all_companies)
     
     return all_companies
 
 
+def _collect_companies(about_files: List[str], results, all_companies: List[Dict[str, Any]]) -> None:
+    """Report each processed file and keep the companies found, in file order."""
+    for file_path, company_info in zip(about_files, results):
+        print(f"Processed {os.path.basename(file_path)}")
+        if company_info:
+            all_companies.append(company_info)
+
+
 def save_to_json(data: List[Dict[str, Any]], output_file: str) -> None:
     """
     Save the extracted data to a JSON file.
@@ -214,8 +287,13 @@ def save_to_json(data: List[Dict[str, Any]], output_file: str) -> None:
         output_file: Path to the output JSON file
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson writes UTF-8 directly, matching ensure_ascii=False
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"\nSaved data to {output_file}")
     except Exception as e:
         print(f"Error saving to {output_file}: {e}")
@@ -4,26 +4,82 @@ import logging
 import os
 from typing import Optional, Tuple
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+# Set once console logging has been configured by the first login
+_LOGGING_DONE = False
+
+# Chromium launch flags that hide common automation fingerprints
+_CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-infobars',
+    '--disable-extensions',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    # Skip downloading photos and logos, which the scraper never reads
+    '--blink-settings=imagesEnabled=false'
+]
+
+# Browser context settings shared by every login
+_CONTEXT_OPTS = {
+    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36',
+    'viewport': {'width': 1920, 'height': 1080},
+    'geolocation': {'latitude': 40.7128, 'longitude': -74.0060},
+    'permissions': ['geolocation']
+}
+
+# Sophisticated anti-detection script
+_ANTI_DETECT_JS = """
+    // Prevent webdriver detection
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    
+    // Simulate real browser environment
+    window.navigator.chrome = {
+        runtime: {},
+        app: {},
+        loadTimes: () => {},
+        csi: () => {}
+    };
+    
+    // Randomize plugins and mimetypes
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [{ name: 'Chrome PDF Plugin' }]
+    });
+"""
+
+
+def _configure_logging():
+    """Configure console logging on the first login only."""
+    global _LOGGING_DONE
+    if _LOGGING_DONE:
+        return
+    logging.basicConfig(
+        level=logging.INFO, 
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+    _LOGGING_DONE = True
+
 
 class LinkedinAuthenticator:
     @classmethod
     async def login(
         cls, 
         email: Optional[str] = None, 
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        playwright: Optional[Playwright] = None
     ) -> Tuple[Browser, BrowserContext, Page]:
         """
         Advanced LinkedIn login with comprehensive error handling and diagnostics
+        
+        Pass a started Playwright instance to launch the browser from it, so the
+        caller can stop its driver once done. Otherwise a new one is started.
         """
-        # Configure logging
         # Configure console logging only
-        logging.basicConfig(
-            level=logging.INFO, 
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler()]
-        )
-        logger = logging.getLogger(__name__)
+        _configure_logging()
 
         # Retrieve credentials from environment if not provided
         if not email:
@@ -36,47 +92,21 @@ class LinkedinAuthenticator:
             raise ValueError("LinkedIn credentials are required")
 
         try:
-            playwright = await async_playwright().start()
+            if playwright is None:
+                playwright = await async_playwright().start()
             
             # Launch browser in headless mode
             browser = await playwright.chromium.launch(
                 headless=True,  # Run in headless mode
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-infobars',
-                    '--disable-extensions',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox'
-                ],
+                args=_CHROMIUM_ARGS,
                 timeout=60000
             )
 
             # Advanced context creation
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                geolocation={'latitude': 40.7128, 'longitude': -74.0060},
-                permissions=['geolocation']
-            )
+            context = await browser.new_context(**_CONTEXT_OPTS)
 
             # Sophisticated anti-detection script
-            await context.add_init_script("""
-                // Prevent webdriver detection
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                
-                // Simulate real browser environment
-                window.navigator.chrome = {
-                    runtime: {},
-                    app: {},
-                    loadTimes: () => {},
-                    csi: () => {}
-                };
-                
-                // Randomize plugins and mimetypes
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [{ name: 'Chrome PDF Plugin' }]
-                });
-            """)
+            await context.add_init_script(_ANTI_DETECT_JS)
 
             page = await context.new_page()
 
@@ -134,7 +164,8 @@ class LinkedinAuthenticator:
         Simulate human-like typing with advanced randomization
         """
         await page.focus(selector)
-        for char in text:
-            # Varied typing speed and small random pauses
-            await page.type(selector, char, delay=random.uniform(50, 250))
-            await page.wait_for_timeout(random.uniform(20, 100))
\ No newline at end of file
+        # Varied typing speed, with the small pause after each key folded into
+        # Playwright's key delay so every character costs a single round trip
+        delays = [random.uniform(70, 350) for _ in text]
+        for char, delay in zip(text, delays):
+            await page.type(selector, char, delay=delay)
\ No newline at end of file
@@ -1,43 +1,42 @@
-from bs4 import BeautifulSoup
+from .parsing import ParsedDocument, read_html_file
 import json
 import os
 
 class ExperienceScraper:
-    def __init__(self, html_file=None, html_content=None):
+    def __init__(self, html_file=None, html_content=None, parsed=None):
         """
         Initialize the experience scraper.
         
         Args:
             html_file (str, optional): Path to HTML file containing experience section
             html_content (str, optional): Raw HTML content string instead of file
+            parsed (ParsedDocument, optional): Already parsed page to reuse instead of parsing again
         """
-        if html_content:
+        if parsed is not None:
+            self.html_content = None
+        elif html_content:
             self.html_content = html_content
         elif html_file:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                self.html_content = f.read()
+            self.html_content = read_html_file(html_file)
         else:
-            raise ValueError("Either html_file or html_content must be provided")
+            raise ValueError("Either html_file, html_content or parsed must be provided")
             
-        self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        self.parsed = parsed if parsed is not None else ParsedDocument.from_html(self.html_content)
 
     def extract_experience(self):
         experiences = []
         
         # Debug: Print all main sections
         print("Available sections in HTML:")
-        for section in self.soup.find_all('main'):
-            if 'aria-label' in section.attrs:
-                print(f"- {section['aria-label']}")
+        for label in self.parsed.main_labels():
+            print(f"- {label}")
         
-        # Find the main experience section
-        main_section = self.soup.find('main', attrs={'aria-label': 'Experience'})
-        if not main_section:
+        # Find the full text of the main experience section
+        experience_text = self.parsed.main_text('Experience')
+        if experience_text is None:
             print("Warning: No Experience section found with aria-label='Experience'")
             return experiences
             
-        # Return full text of experiences
-        experience_text = main_section.get_text(separator=' | ', strip=True)
         experiences.append(experience_text)
         
         return experiences
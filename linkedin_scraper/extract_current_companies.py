@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """
 Extract company profile links from LinkedIn experiences where the duration includes 'present'.
-Returns a list of company profile URLs.
+Returns a set of company profile URLs.
 """
 
 import os
-from bs4 import BeautifulSoup
+import re
+import soupsieve as sv
+from .parsing import make_soup, read_html_file
 
 
-def extract_current_companies(html_source) -> list:
+# Date ranges of current positions read e.g. 'Jan 2020 - Present'
+_PRESENT_RE = re.compile(r'present', re.IGNORECASE)
+
+# Company links inside experience items that have a date range
+_COMPANY_LINK_SELECTOR = sv.compile(
+    'li.pvs-list__paged-list-item:has(span.pvs-entity__caption-wrapper) a[href*="/company/"]'
+)
+
+# The date range of an experience item
+_DATE_RANGE_SELECTOR = sv.compile('span.pvs-entity__caption-wrapper')
+
+
+def extract_current_companies(html_source) -> set:
     """
     Extract company profile links from LinkedIn experiences HTML where duration is 'present'.
     
@@ -16,47 +30,51 @@ def extract_current_companies(html_source) -> list:
         html_source: Either a path to an HTML file or a string containing HTML content
         
     Returns:
-        List of company profile URLs
+        Set of company profile URLs
     """
     try:
         # Check if html_source is a file path or HTML content
         if isinstance(html_source, str):
-            if os.path.exists(html_source):
+            try:
                 # It's a file path
-                with open(html_source, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-            else:
-                # It's HTML content
+                html_content = read_html_file(html_source)
+            except (OSError, ValueError):
+                # It's HTML content (too long, or otherwise not a readable path)
                 html_content = html_source
         else:
             raise ValueError("html_source must be a file path or HTML content string")
             
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
-        company_urls = []
+        company_urls = set()
         
-        # Find all experience items
-        experience_items = soup.select('li.pvs-list__paged-list-item')
+        # Find company links in experience items that have a date range
+        company_links = _COMPANY_LINK_SELECTOR.select(soup)
         
-        for item in experience_items:
+        # Experience items already handled, so only each item's first company link is used
+        seen_items = set()
+        
+        for link in company_links:
+            item = link.find_parent('li', class_='pvs-list__paged-list-item')
+            if id(item) in seen_items:
+                continue
+            seen_items.add(id(item))
+            
             # Look for date range containing 'present'
-            date_el = item.select_one('span.pvs-entity__caption-wrapper')
-            if not date_el or 'present' not in date_el.get_text(strip=True).lower():
+            date_el = _DATE_RANGE_SELECTOR.select_one(item)
+            if not date_el or not _PRESENT_RE.search(date_el.get_text(strip=True)):
                 continue
                 
-            # Find company link
-            link = item.find('a', href=lambda x: x and '/company/' in x)
-            if link and link.get('href'):
-                url = link['href']
-                if not url.startswith('http'):
-                    url = f"https://www.linkedin.com{url}"
-                company_urls.append(url)
+            url = link['href']
+            if not url.startswith('http'):
+                url = f"https://www.linkedin.com{url}"
+            company_urls.add(url)
         
-        return set(company_urls)
+        return company_urls
         
     except Exception as e:
         print(f"Error: {e}")
-        return []
+        return set()
 
 
 def main():
@@ -71,9 +89,9 @@ def main():
     # Get company URLs
     company_urls = extract_current_companies(html_file)
     
-    # Print the list of URLs
-    print(set(company_urls))
-    return set(company_urls)
+    # Print the set of URLs
+    print(company_urls)
+    return company_urls
 
 
 if __name__ == '__main__':
@@ -1,40 +1,38 @@
-from bs4 import BeautifulSoup
+from .parsing import ParsedDocument, read_html_file
 import json
 import os
 
 class LanguageScraper:
-    def __init__(self, html_file=None, html_content=None):
+    def __init__(self, html_file=None, html_content=None, parsed=None):
         """
         Initialize the language scraper.
         
         Args:
             html_file (str, optional): Path to HTML file containing language section
             html_content (str, optional): Raw HTML content string instead of file
+            parsed (ParsedDocument, optional): Already parsed page to reuse instead of parsing again
         """
-        if html_content:
+        if parsed is not None:
+            self.html_content = None
+        elif html_content:
             self.html_content = html_content
         elif html_file:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                self.html_content = f.read()
+            self.html_content = read_html_file(html_file)
         else:
-            raise ValueError("Either html_file or html_content must be provided")
+            raise ValueError("Either html_file, html_content or parsed must be provided")
             
-        self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        self.parsed = parsed if parsed is not None else ParsedDocument.from_html(self.html_content)
 
     def extract_languages(self):
         languages = []
         
-        # Find the main languages section
-        main_section = self.soup.find('main', attrs={'aria-label': 'Languages'})
-        if not main_section:
-            # Try alternative section name
-            main_section = self.soup.find('main', attrs={'aria-label': 'Language'})
-            if not main_section:
-                print("Warning: No Languages section found")
-                return languages
+        # Find the full text of the main languages section, trying the
+        # alternative section name too
+        language_text = self.parsed.main_text('Languages', 'Language')
+        if language_text is None:
+            print("Warning: No Languages section found")
+            return languages
                 
-        # Return full text of languages
-        language_text = main_section.get_text(separator=' | ', strip=True)
         languages.append(language_text)
         
         return languages
@@ -1,25 +1,27 @@
-from bs4 import BeautifulSoup
+from .parsing import ParsedDocument, read_html_file
 import json
 import os
 
 class LicenseCertificationScraper:
-    def __init__(self, html_file=None, html_content=None):
+    def __init__(self, html_file=None, html_content=None, parsed=None):
         """
         Initialize the license and certification scraper.
         
         Args:
             html_file (str, optional): Path to HTML file containing license/certification section
             html_content (str, optional): Raw HTML content string instead of file
+            parsed (ParsedDocument, optional): Already parsed page to reuse instead of parsing again
         """
-        if html_content:
+        if parsed is not None:
+            self.html_content = None
+        elif html_content:
             self.html_content = html_content
         elif html_file:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                self.html_content = f.read()
+            self.html_content = read_html_file(html_file)
         else:
-            raise ValueError("Either html_file or html_content must be provided")
+            raise ValueError("Either html_file, html_content or parsed must be provided")
             
-        self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        self.parsed = parsed if parsed is not None else ParsedDocument.from_html(self.html_content)
 
     def extract_licenses_certifications(self):
         """
@@ -28,19 +30,17 @@ class LicenseCertificationScraper:
         """
         certifications = []
         
-        # Find the main certifications section
-        main_section = self.soup.find('main', attrs={'aria-label': 'Licenses & certifications'})
-        if not main_section:
-            # Try alternative section names
-            main_section = self.soup.find('main', attrs={'aria-label': 'Licenses & Certifications'})
-            if not main_section:
-                main_section = self.soup.find('main', attrs={'aria-label': 'Licenses'})
-                if not main_section:
-                    print("Warning: No Licenses & Certifications section found")
-                    return certifications
+        # Find the full text of the main certifications section, trying the
+        # alternative section names too
+        certs_text = self.parsed.main_text(
+            'Licenses & certifications',
+            'Licenses & Certifications',
+            'Licenses'
+        )
+        if certs_text is None:
+            print("Warning: No Licenses & Certifications section found")
+            return certifications
         
-        # Return full text of certifications
-        certs_text = main_section.get_text(separator=' | ', strip=True)
         certifications.append(certs_text)
         
         return certifications
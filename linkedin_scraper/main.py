@@ -6,6 +6,11 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,7 +26,8 @@ async def scrape_linkedin_profile(
     profile_url: str, 
     email: Optional[str] = None, 
     password: Optional[str] = None, 
-    debug_mode: bool = False
+    debug_mode: bool = False,
+    scraper: Optional[LinkedinProfileScraper] = None
 ) -> Optional[Dict]:
     """
     Scrape a LinkedIn profile and return the parsed data.
@@ -31,6 +37,9 @@ async def scrape_linkedin_profile(
         email (str, optional): LinkedIn login email. Defaults to environment variable LINKEDIN_EMAIL.
         password (str, optional): LinkedIn login password. Defaults to environment variable LINKEDIN_PASSWORD.
         debug_mode (bool, optional): If True, save HTML files to disk for debugging
+        scraper (LinkedinProfileScraper, optional): Scraper whose logged-in browser session
+            is reused, e.g. when scraping many profiles. The caller closes it with close().
+            By default a new scraper is created and closed for this profile.
         
     Returns:
         dict: The scraped and parsed profile data or None if scraping failed
@@ -51,9 +60,12 @@ async def scrape_linkedin_profile(
         >>>     password='your_password'
         >>> ))
     """
+    # Only close the scraper's browser session if it was created here
+    owns_scraper = scraper is None
     try:
         # Create scraper instance with debug mode setting
-        scraper = LinkedinProfileScraper(debug_mode=debug_mode)
+        if owns_scraper:
+            scraper = LinkedinProfileScraper(debug_mode=debug_mode)
         
         # Scrape single profile
         success, html_content = await scraper.scrape_profile(
@@ -67,7 +79,7 @@ async def scrape_linkedin_profile(
             profile_builder = ProfileBuilder(html_content_dict=html_content)
             
             # Build the profile data
-            profile_data = profile_builder.scrape_profile()
+            profile_data = await profile_builder.scrape_profile()
             
             return profile_data
         else:
@@ -78,13 +90,38 @@ async def scrape_linkedin_profile(
         import traceback
         logger.error(traceback.format_exc())
         return None
+    finally:
+        if owns_scraper and scraper is not None:
+            # A failed close must not replace the result or the original error
+            try:
+                await scraper.close()
+            except Exception as e:
+                logger.error(f"Error closing the scraper: {e}")
+
+def _write_json(data: Dict, output_file: str) -> None:
+    """
+    Serialise data and write it to a JSON file.
+    
+    Args:
+        data (dict): The data to save
+        output_file (str): Path to save the JSON output
+    """
+    if orjson is not None:
+        # orjson writes UTF-8 bytes directly, matching ensure_ascii=False
+        Path(output_file).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 async def save_profile_to_json(
     profile_url: str, 
     output_file: str = 'linkedin_profile.json',
     email: Optional[str] = None,
     password: Optional[str] = None,
-    debug_mode: bool = False
+    debug_mode: bool = False,
+    scraper: Optional[LinkedinProfileScraper] = None
 ) -> bool:
     """
     Scrape a LinkedIn profile and save the data to a JSON file.
@@ -95,6 +132,8 @@ async def save_profile_to_json(
         email (str, optional): LinkedIn login email
         password (str, optional): LinkedIn login password
         debug_mode (bool, optional): If True, save HTML files to disk for debugging
+        scraper (LinkedinProfileScraper, optional): Scraper to reuse across calls,
+            see scrape_linkedin_profile
         
     Returns:
         bool: True if successful, False otherwise
@@ -105,13 +144,14 @@ async def save_profile_to_json(
             profile_url,
             email=email,
             password=password,
-            debug_mode=debug_mode
+            debug_mode=debug_mode,
+            scraper=scraper
         )
         
         if profile_data:
-            # Save the profile data to a JSON file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            # Save the profile data to a JSON file off the event loop thread
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_json, profile_data, output_file)
             
             logger.info(f"Profile data has been saved to {os.path.abspath(output_file)}")
             return True
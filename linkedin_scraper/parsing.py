@@ -0,0 +1,230 @@
+"""
+Shared HTML parsing helpers for the LinkedIn section scrapers.
+
+The section scrapers parse with selectolax (lexbor) when it is installed,
+and with lxml otherwise. Set LINKEDIN_SCRAPER_PARSER=lxml to force the
+lxml path, e.g. when checking the two backends against each other.
+The profile builder falls back to BeautifulSoup instead.
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+USE_SELECTOLAX = (
+    LexborHTMLParser is not None
+    and os.environ.get('LINKEDIN_SCRAPER_PARSER', 'selectolax') != 'lxml'
+)
+
+# Subtrees whose text BeautifulSoup's get_text() leaves out
+_SKIPPED_TAGS = frozenset(('script', 'style', 'template', '-comment'))
+
+# The same filter for the lxml path, as an XPath over a node's text nodes
+_TEXT_XPATH = './/text()[not(ancestor::script or ancestor::style or ancestor::template)]'
+
+
+def read_html_file(path) -> bytes:
+    """
+    Read an HTML file as UTF-8 bytes.
+
+    The parsers decode the bytes themselves, so the file is never decoded
+    into a separate str first.
+
+    Args:
+        path: Path to the HTML file
+
+    Returns:
+        The raw file contents
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _get_parser():
+    """Import BeautifulSoup on first use, so importing the package stays cheap."""
+    from bs4 import BeautifulSoup, FeatureNotFound
+    return BeautifulSoup, FeatureNotFound
+
+
+def make_soup(html_content, parse_only=None) -> 'BeautifulSoup':
+    """
+    Build a BeautifulSoup tree, preferring the C-based lxml parser.
+
+    Falls back to Python's built-in html.parser if lxml is not installed.
+
+    Args:
+        html_content: Raw HTML markup to parse, as str or UTF-8 bytes
+        parse_only: Optional SoupStrainer limiting which elements are built
+
+    Returns:
+        The parsed BeautifulSoup tree
+    """
+    BeautifulSoup, FeatureNotFound = _get_parser()
+
+    # Bytes come from read_html_file(), so skip encoding detection
+    options = {'from_encoding': 'utf-8'} if isinstance(html_content, bytes) else {}
+    if parse_only is not None:
+        options['parse_only'] = parse_only
+    try:
+        return BeautifulSoup(html_content, 'lxml', **options)
+    except FeatureNotFound:
+        return BeautifulSoup(html_content, 'html.parser', **options)
+
+
+def main_soup(html_content, main_label: str) -> 'BeautifulSoup':
+    """
+    Build a BeautifulSoup tree of just one <main> element with make_soup().
+
+    Args:
+        html_content: Raw HTML markup to parse, as str or UTF-8 bytes
+        main_label: aria-label of the <main> element to build, e.g. 'Skills'
+
+    Returns:
+        The parsed BeautifulSoup tree
+    """
+    from bs4 import SoupStrainer
+    return make_soup(html_content, parse_only=SoupStrainer('main', attrs={'aria-label': main_label}))
+
+
+def parse_html(html_content):
+    """
+    Parse HTML with selectolax, or lxml if selectolax is disabled.
+
+    Args:
+        html_content: Raw HTML markup to parse, as str or UTF-8 bytes
+
+    Returns:
+        A tree to pass to find_main() and main_labels()
+    """
+    if USE_SELECTOLAX:
+        return LexborHTMLParser(html_content)
+
+    import lxml.html
+    from lxml.etree import ParserError
+
+    # lxml would guess a legacy charset for bytes without a <meta> charset.
+    # A fresh parser is used per call since lxml parsers are not thread-safe.
+    parser = lxml.html.HTMLParser(encoding='utf-8') if isinstance(html_content, bytes) else None
+    try:
+        return lxml.html.document_fromstring(html_content, parser=parser)
+    except ParserError:
+        # lxml refuses to parse an empty document
+        return lxml.html.Element('html')
+
+
+def find_main(tree, label: str):
+    """
+    Find the <main> element with the given aria-label.
+
+    Args:
+        tree: A tree returned by parse_html()
+        label: Value of the aria-label attribute, e.g. 'Education'
+
+    Returns:
+        The matching node, or None if there is none
+    """
+    if USE_SELECTOLAX:
+        return tree.css_first(f'main[aria-label="{label}"]')
+    matches = tree.xpath('//main[@aria-label=$label]', label=label)
+    return matches[0] if matches else None
+
+
+def main_labels(tree) -> List[Optional[str]]:
+    """
+    List the aria-labels of every <main> element in the tree.
+
+    Args:
+        tree: A tree returned by parse_html()
+
+    Returns:
+        The aria-label of each labelled <main> element, in document order
+    """
+    if USE_SELECTOLAX:
+        return [node.attributes['aria-label'] for node in tree.css('main[aria-label]')]
+    return [str(label) for label in tree.xpath('//main/@aria-label')]
+
+
+def _iter_strings(node) -> Iterator[str]:
+    """Yield the stripped, non-empty text nodes under a selectolax node."""
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            text = child.text(deep=False).strip()
+            if text:
+                yield text
+        elif child.tag not in _SKIPPED_TAGS:
+            yield from _iter_strings(child)
+
+
+def node_text(node, separator: str = ' | ') -> str:
+    """
+    Join the stripped text of a node, like get_text(separator, strip=True).
+
+    Args:
+        node: A node returned by find_main()
+        separator: String placed between text fragments
+
+    Returns:
+        The node's text content
+    """
+    if USE_SELECTOLAX:
+        return separator.join(_iter_strings(node))
+    return separator.join(filter(None, (text.strip() for text in node.xpath(_TEXT_XPATH))))
+
+
+@dataclass
+class ParsedDocument:
+    """
+    A parsed HTML page that several scrapers can share.
+
+    The page is parsed once, and the text of each <main> section is
+    computed the first time it is asked for.
+    """
+    tree: Any
+    _main_text: Dict[Tuple[str, ...], Optional[str]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_html(cls, html_content) -> 'ParsedDocument':
+        """
+        Parse raw HTML into a ParsedDocument.
+
+        Args:
+            html_content: Raw HTML markup to parse, as str or UTF-8 bytes
+
+        Returns:
+            The parsed document
+        """
+        return cls(parse_html(html_content))
+
+    def main_labels(self) -> List[Optional[str]]:
+        """Return the aria-labels of the page's <main> elements."""
+        return main_labels(self.tree)
+
+    def main_text(self, *labels: str) -> Optional[str]:
+        """
+        Get the text of the first <main> element matching one of the labels.
+
+        Args:
+            *labels: aria-label values to try, in order
+
+        Returns:
+            The section text joined with ' | ', or None if no label matches
+        """
+        if labels not in self._main_text:
+            text = None
+            for label in labels:
+                node = find_main(self.tree, label)
+                if node is not None:
+                    text = node_text(node)
+                    break
+            self._main_text[labels] = text
+        return self._main_text[labels]
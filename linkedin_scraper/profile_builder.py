@@ -1,19 +1,57 @@
-from bs4 import BeautifulSoup
+import asyncio
 import json
-import re
+import logging
 import os
-from .skills_scraper import SkillsScraper
-from .language_scraper import LanguageScraper
-from .license_certification_scraper import LicenseCertificationScraper
-from .project_scraper import ProjectScraper
-from .education_scraper import EducationScraper
-from .experience_scraper import ExperienceScraper
-from .about_scraper import process_about_file
+from .parsing import USE_SELECTOLAX, ParsedDocument, make_soup, node_text, parse_html
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+# Directory of this module, resolved once at import
+_MODULE_DIR = Path(__file__).resolve().parent
+
 # from skills_scraper import SkillsScraper
 # from language_scraper import LanguageScraper
 # from license_certification_scraper import LicenseCertificationScraper
 
+# Profile card sections, and the heading that names each one
+_PROFILE_CARD_SELECTOR = 'section[class*="pv-profile-card"]'
+_HEADING_SELECTOR = 'h2[class*="heading"], h1[class*="heading"]'
+
+# Heading prefixes of the profile card sections that get extracted, and the
+# section kind each one is bucketed under
+_SECTION_KEYWORDS = {
+    'Experience': 'experiences',
+    'Education': 'education',
+    'Skills': 'skills',
+    'Languages': 'languages',
+    'Licenses': 'licenses',
+    'Certifications': 'licenses',
+    'Projects': 'projects',
+}
+
+# Elements read by the name and headline extractors
+_TITLE_SELECTOR = 'title'
+_NAME_HEADING_SELECTOR = 'h1[class*="text-heading-xlarge"]'
+_HEADLINE_SELECTOR = 'div[class*="text-body-medium"]'
+
+# The About text, in an inline-show-more div after the div with id="about".
+# The visible copy is tried first, then the visually-hidden one.
+_ABOUT_TEXT_SELECTORS = (
+    'div#about ~ div div[class*="inline-show-more-text"] span[aria-hidden="true"]',
+    'div#about ~ div div[class*="inline-show-more-text"] span.visually-hidden',
+)
+
+# html_content_dict keys of the per-company pages that are not the 'best' page
+_PARTIAL_COMPANY_SUFFIXES = ('_main_html', '_about_html')
+
 class LinkedInProfileScraper:
     def __init__(self, html_file=None, session_dir=None, html_content=None, html_content_dict=None):
         """
@@ -42,268 +80,295 @@ class LinkedInProfileScraper:
         else:
             raise ValueError("Either html_file, html_content, or html_content_dict with 'profile_html' key must be provided")
             
-        # Parse the HTML content
-        self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        # The soup and the selectolax tree are only built when an extractor
+        # first reads them
+        self._soup = None
+        self._selectolax_tree = None
         
         # Store the session directory if provided
         self.session_dir = session_dir
+        
+        # Parsed expanded-section pages, shared between the section scrapers
+        self._documents = {}
+        
+        # Profile card sections by heading, filled in by _bucket_sections()
+        self._sections = None
+
+    @property
+    def soup(self):
+        """
+        The BeautifulSoup tree of the profile page, parsed on first access.
+        
+        The extractors only read it when selectolax is disabled.
+        """
+        if self._soup is None:
+            self._soup = make_soup(self.html_content)
+        return self._soup
+
+    @property
+    def _tree(self):
+        """
+        The selectolax tree of the profile page, parsed on first access.
+        
+        The profile page is queried through it when selectolax is enabled,
+        and through the soup otherwise.
+        """
+        if self._selectolax_tree is None:
+            self._selectolax_tree = parse_html(self.html_content)
+        return self._selectolax_tree
+
+    def _parsed_document(self, key):
+        """Parse the page stored under key in html_content_dict, once per builder."""
+        if key not in self._documents:
+            self._documents[key] = ParsedDocument.from_html(self.html_content_dict[key])
+        return self._documents[key]
+
+    def _section_text(self, section):
+        """
+        Get a section's text read in the browser, stored as '{section}_text'.
+        
+        Returns:
+            str: The section text, or None if only HTML was captured for it
+        """
+        text = self.html_content_dict.get(f'{section}_text')
+        if text is None and self.session_dir:
+            text_file = os.path.join(self.session_dir, f'{section}_text.txt')
+            if os.path.exists(text_file):
+                with open(text_file, 'r', encoding='utf-8') as f:
+                    text = f.read()
+        return text
+
+    def _bucket_sections(self):
+        """
+        Map each section kind to the first profile card whose heading starts with it.
+        
+        The profile cards are walked once per builder, and the result is shared
+        by all the section extractors.
+        
+        Returns:
+            dict: Section kind from _SECTION_KEYWORDS to its section node
+        """
+        if self._sections is None:
+            self._sections = {}
+            for section in self._query(_PROFILE_CARD_SELECTOR):
+                header = self._query_one(_HEADING_SELECTOR, section)
+                if header is None:
+                    continue
+                header_text = self._text(header)
+                for keyword, kind in _SECTION_KEYWORDS.items():
+                    if header_text.startswith(keyword):
+                        self._sections.setdefault(kind, section)
+                        break
+        return self._sections
+
+    def _uncaptured(self, kind):
+        """
+        Get the result for a section whose expanded page was not captured.
+        
+        Returns:
+            The profile card's text as a one-item list, or None if the card has
+            a "Show all" link, as it then only lists part of the section. An
+            empty list if the profile has no such card.
+        """
+        section = self._bucket_sections().get(kind)
+        if section is None:
+            return []
+        full_text = self._text(section, ' | ')
+        if 'Show all' in full_text:
+            return None
+        return [full_text]
+
+    def _query(self, selector, node=None):
+        """Select all nodes matching a CSS selector, within node if given."""
+        if USE_SELECTOLAX:
+            return (self._tree if node is None else node).css(selector)
+        return (self.soup if node is None else node).select(selector)
+
+    def _query_one(self, selector, node=None):
+        """Select the first node matching a CSS selector, or None."""
+        if USE_SELECTOLAX:
+            return (self._tree if node is None else node).css_first(selector)
+        return (self.soup if node is None else node).select_one(selector)
+
+    @staticmethod
+    def _text(node, separator=''):
+        """Join the stripped text of a node returned by _query()."""
+        if USE_SELECTOLAX:
+            return node_text(node, separator)
+        return node.get_text(separator=separator, strip=True)
+
+    @staticmethod
+    def _string(node, separator=''):
+        """Get the unstripped text of a node returned by _query(), like get_text()."""
+        if USE_SELECTOLAX:
+            return node.text(separator=separator)
+        return node.get_text(separator)
 
     def extract_name(self):
         """Extract the profile name."""
         # Try multiple methods to extract name
-        name_elem = self.soup.find('title')
-        if name_elem:
+        name_elem = self._query_one(_TITLE_SELECTOR)
+        if name_elem is not None:
             # Extract name from title, removing " | LinkedIn"
-            name = name_elem.text.replace(' | LinkedIn', '').strip()
-            # Remove leading number if present
-            name = re.sub(r'^\(\d+\)\s*', '', name).strip()
-            return name
+            name = self._string(name_elem).strip()
+            if name.endswith('| LinkedIn'):
+                name = name[:-len('| LinkedIn')]
+            # Remove the leading "(N)" notification count if present
+            if name.startswith('('):
+                end = name.find(')')
+                if end > 1 and name[1:end].isdigit():
+                    name = name[end + 1:]
+            name = name.strip()
+            if name:
+                return name
         
         # Fallback to other potential name locations
-        name_elem = self.soup.find('h1', class_=re.compile(r'.*text-heading-xlarge.*'))
-        if name_elem:
-            return name_elem.text.strip()
+        name_elem = self._query_one(_NAME_HEADING_SELECTOR)
+        if name_elem is not None:
+            return self._string(name_elem).strip()
         
         return None
 
     def extract_headline(self):
         """Extract the professional headline."""
-        headline_elem = self.soup.find('div', class_=re.compile(r'.*text-body-medium.*'))
-        if headline_elem:
-            return headline_elem.text.strip()
+        headline_elem = self._query_one(_HEADLINE_SELECTOR)
+        if headline_elem is not None:
+            return self._string(headline_elem).strip()
         return None
 
     def extract_experiences(self):
         """Extract work experiences from LinkedIn profile."""
-        experiences = []
-        
-        # Find all sections with profile card class
-        all_sections = self.soup.find_all('section', class_=re.compile(r'.*pv-profile-card.*'))
-        
-        for section in all_sections:
-            # Extract section header if exists
-            header = section.find(['h2', 'h1'], class_=re.compile(r'.*heading.*'))
+        # Use the expanded experiences page when one was captured
+        try:
+            from .experience_scraper import ExperienceScraper
             
-            # If this is the Experience section
-            if header and 'Experience' in header.get_text(strip=True):
-                full_text = section.get_text(separator=' | ', strip=True)
-                
-                # Check if we need to expand experiences (Show all)
-                if 'Show all' in full_text:
-                    try:
-                        # Try to get from memory first
-                        if self.html_content_dict and 'experiences_expanded_html' in self.html_content_dict:
-                            scraper = ExperienceScraper(html_content=self.html_content_dict['experiences_expanded_html'])
-                            experiences = scraper.extract_experience()
-                            return experiences
-                        # Fall back to file if session directory is provided
-                        elif self.session_dir:
-                            exp_file = os.path.join(self.session_dir, 'experiences_expanded_html.txt')
-                            if os.path.exists(exp_file):
-                                scraper = ExperienceScraper(exp_file)
-                                experiences = scraper.extract_experience()
-                                return experiences
-                    except Exception as e:
-                        print(f"Error expanding experiences: {e}")
-                
-                # If we couldn't expand or no need to expand, return basic experiences
-                experiences.append(full_text)
+            # Try to get from memory first
+            if 'experiences_expanded_html' in self.html_content_dict:
+                scraper = ExperienceScraper(parsed=self._parsed_document('experiences_expanded_html'))
+                return scraper.extract_experience()
+            # Fall back to file if session directory is provided
+            if self.session_dir:
+                exp_file = os.path.join(self.session_dir, 'experiences_expanded_html.txt')
+                if os.path.exists(exp_file):
+                    scraper = ExperienceScraper(exp_file)
+                    return scraper.extract_experience()
+        except Exception:
+            logger.exception("Error expanding experiences")
         
-        return experiences
+        return self._uncaptured('experiences')
 
     def extract_education(self):
         """Extract education details from LinkedIn profile."""
-        education = []
-        
-        # Find all sections with profile card class
-        all_sections = self.soup.find_all('section', class_=re.compile(r'.*pv-profile-card.*'))
-        
-        for section in all_sections:
-            # Extract section header if exists
-            header = section.find(['h2', 'h1'], class_=re.compile(r'.*heading.*'))
+        # Use the expanded education page when one was captured
+        try:
+            from .education_scraper import EducationScraper
             
-            # If this is the Education section
-            if header and 'Education' in header.get_text(strip=True):
-                full_text = section.get_text(separator=' | ', strip=True)
-                
-                # Check if we need to expand education (Show all)
-                if 'Show all' in full_text:
-                    try:
-                        # Try to get from memory first
-                        if self.html_content_dict and 'education_expanded_html' in self.html_content_dict:
-                            scraper = EducationScraper(html_content=self.html_content_dict['education_expanded_html'])
-                            education = scraper.scrape_education()
-                            return education
-                        # Fall back to file if session directory is provided
-                        elif self.session_dir:
-                            edu_file = os.path.join(self.session_dir, 'education_expanded_html.txt')
-                            if os.path.exists(edu_file):
-                                scraper = EducationScraper(edu_file)
-                                education = scraper.scrape_education()
-                                return education
-                    except Exception as e:
-                        print(f"Error expanding education: {e}")
-                
-                # If we couldn't expand or no need to expand, return basic education
-                education.append(full_text)
+            # Try to get from memory first
+            if 'education_expanded_html' in self.html_content_dict:
+                scraper = EducationScraper(parsed=self._parsed_document('education_expanded_html'))
+                return scraper.scrape_education()
+            # Fall back to file if session directory is provided
+            if self.session_dir:
+                edu_file = os.path.join(self.session_dir, 'education_expanded_html.txt')
+                if os.path.exists(edu_file):
+                    scraper = EducationScraper(edu_file)
+                    return scraper.scrape_education()
+        except Exception:
+            logger.exception("Error expanding education")
         
-        return education
+        return self._uncaptured('education')
 
     def extract_skills(self):
         """Extract skills from LinkedIn profile."""
-        skills = []
-        
-        # Find all sections with profile card class
-        all_sections = self.soup.find_all('section', class_=re.compile(r'.*pv-profile-card.*'))
-        
-        for section in all_sections:
-            # Extract section header if exists
-            header = section.find(['h2', 'h1'], class_=re.compile(r'.*heading.*'))
+        # Use the expanded skills page when one was captured
+        try:
+            from .skills_scraper import SkillsScraper
             
-            # If this is the Skills section
-            if header and 'Skills' in header.get_text(strip=True):
-                full_text = section.get_text(separator=' | ', strip=True)
-                
-                # Check if we need to expand skills (Show all)
-                if 'Show all' in full_text:
-                    try:
-                        # Try to get from memory first
-                        if self.html_content_dict and 'skills_expanded_html' in self.html_content_dict:
-                            scraper = SkillsScraper(html_content=self.html_content_dict['skills_expanded_html'])
-                            skills = scraper.scrape_skills()
-                            return skills
-                        # Fall back to file if session directory is provided
-                        elif self.session_dir:
-                            skills_file = os.path.join(self.session_dir, 'skills_expanded_html.txt')
-                            if os.path.exists(skills_file):
-                                scraper = SkillsScraper(skills_file)
-                                skills = scraper.scrape_skills()
-                                return skills
-                    except Exception as e:
-                        print(f"Error expanding skills: {e}")
-                
-                # Return the full text of the skills section
-                skills.append(full_text)
-                return skills
+            # Text read in the browser needs no parsing
+            text = self._section_text('skills')
+            if text is not None:
+                return [text] if text else []
+            # Try to get from memory first
+            if 'skills_expanded_html' in self.html_content_dict:
+                scraper = SkillsScraper(html_content=self.html_content_dict['skills_expanded_html'])
+                return scraper.scrape_skills()
+            # Fall back to file if session directory is provided
+            if self.session_dir:
+                skills_file = os.path.join(self.session_dir, 'skills_expanded_html.txt')
+                if os.path.exists(skills_file):
+                    scraper = SkillsScraper(skills_file)
+                    return scraper.scrape_skills()
+        except Exception:
+            logger.exception("Error expanding skills")
         
-        return skills
+        return self._uncaptured('skills')
 
     def extract_languages(self):
         """Extract languages from LinkedIn profile."""
-        languages = []
-        
-        # Find all sections with profile card class
-        all_sections = self.soup.find_all('section', class_=re.compile(r'.*pv-profile-card.*'))
-        
-        for section in all_sections:
-            # Extract section header if exists
-            header = section.find(['h2', 'h1'], class_=re.compile(r'.*heading.*'))
+        # Use the expanded languages page when one was captured
+        try:
+            from .language_scraper import LanguageScraper
             
-            # If this is the Languages section
-            if header and 'Languages' in header.get_text(strip=True):
-                full_text = section.get_text(separator=' | ', strip=True)
-                
-                # Check if we need to expand languages (Show all)
-                if 'Show all' in full_text:
-                    try:
-                        # Try to get from memory first
-                        if self.html_content_dict and 'languages_expanded_html' in self.html_content_dict:
-                            scraper = LanguageScraper(html_content=self.html_content_dict['languages_expanded_html'])
-                            languages = scraper.scrape_languages()
-                            return languages
-                        # Fall back to file if session directory is provided
-                        elif self.session_dir:
-                            lang_file = os.path.join(self.session_dir, 'languages_expanded_html.txt')
-                            if os.path.exists(lang_file):
-                                scraper = LanguageScraper(lang_file)
-                                languages = scraper.scrape_languages()
-                                return languages
-                    except Exception as e:
-                        print(f"Error expanding languages: {e}")
-                
-                # Return the full text of the languages section
-                languages.append(full_text)
-                return languages
+            # Try to get from memory first
+            if 'languages_expanded_html' in self.html_content_dict:
+                scraper = LanguageScraper(parsed=self._parsed_document('languages_expanded_html'))
+                return scraper.scrape_languages()
+            # Fall back to file if session directory is provided
+            if self.session_dir:
+                lang_file = os.path.join(self.session_dir, 'languages_expanded_html.txt')
+                if os.path.exists(lang_file):
+                    scraper = LanguageScraper(lang_file)
+                    return scraper.scrape_languages()
+        except Exception:
+            logger.exception("Error expanding languages")
         
-        return languages
+        return self._uncaptured('languages')
 
     def extract_licenses_certifications(self):
         """Extract licenses and certifications from LinkedIn profile."""
-        licenses = []
-        
-        # Find all sections with profile card class
-        all_sections = self.soup.find_all('section', class_=re.compile(r'.*pv-profile-card.*'))
-        
-        for section in all_sections:
-            # Extract section header if exists
-            header = section.find(['h2', 'h1'], class_=re.compile(r'.*heading.*'))
+        # Use the expanded licenses page when one was captured
+        try:
+            from .license_certification_scraper import LicenseCertificationScraper
             
-            # If this is the Licenses & certifications section
-            if header and any(x in header.get_text(strip=True) for x in ['Licenses', 'Certifications']):
-                full_text = section.get_text(separator=' | ', strip=True)
-                
-                # Check if we need to expand licenses (Show all)
-                if 'Show all' in full_text:
-                    try:
-                        # Try to get from memory first
-                        if self.html_content_dict and 'licenses_and_certifications_expanded_html' in self.html_content_dict:
-                            scraper = LicenseCertificationScraper(html_content=self.html_content_dict['licenses_and_certifications_expanded_html'])
-                            licenses = scraper.extract_licenses_certifications()
-                            return licenses
-                        # Fall back to file if session directory is provided
-                        elif self.session_dir:
-                            lic_file = os.path.join(self.session_dir, 'licenses_and_certifications_expanded_html.txt')
-                            if os.path.exists(lic_file):
-                                scraper = LicenseCertificationScraper(lic_file)
-                                licenses = scraper.extract_licenses_certifications()
-                                return licenses
-                    except Exception as e:
-                        print(f"Error expanding licenses: {e}")
-                
-                # Return the full text of the licenses section
-                licenses.append(full_text)
-                return licenses
+            # Try to get from memory first
+            if 'licenses_and_certifications_expanded_html' in self.html_content_dict:
+                scraper = LicenseCertificationScraper(parsed=self._parsed_document('licenses_and_certifications_expanded_html'))
+                return scraper.extract_licenses_certifications()
+            # Fall back to file if session directory is provided
+            if self.session_dir:
+                lic_file = os.path.join(self.session_dir, 'licenses_and_certifications_expanded_html.txt')
+                if os.path.exists(lic_file):
+                    scraper = LicenseCertificationScraper(lic_file)
+                    return scraper.extract_licenses_certifications()
+        except Exception:
+            logger.exception("Error expanding licenses")
         
-        return licenses
+        return self._uncaptured('licenses')
 
     def extract_projects(self):
         """Extract projects from LinkedIn profile."""
-        projects = []
-        
-        # Find all sections with profile card class
-        all_sections = self.soup.find_all('section', class_=re.compile(r'.*pv-profile-card.*'))
-        
-        for section in all_sections:
-            # Extract section header if exists
-            header = section.find(['h2', 'h1'], class_=re.compile(r'.*heading.*'))
+        # Use the expanded projects page when one was captured
+        try:
+            from .project_scraper import ProjectScraper
             
-            # If this is the Projects section
-            if header and 'Projects' in header.get_text(strip=True):
-                full_text = section.get_text(separator=' | ', strip=True)
-                
-                # Check if we need to expand projects (Show all)
-                if 'Show all' in full_text:
-                    try:
-                        # Try to get from memory first
-                        if self.html_content_dict and 'projects_expanded_html' in self.html_content_dict:
-                            scraper = ProjectScraper(html_content=self.html_content_dict['projects_expanded_html'])
-                            projects = scraper.scrape_projects()
-                            return projects
-                        # Fall back to file if session directory is provided
-                        elif self.session_dir:
-                            proj_file = os.path.join(self.session_dir, 'projects_expanded_html.txt')
-                            if os.path.exists(proj_file):
-                                scraper = ProjectScraper(proj_file)
-                                projects = scraper.scrape_projects()
-                                return projects
-                    except Exception as e:
-                        print(f"Error expanding projects: {e}")
-                
-                # If we couldn't expand or no need to expand, return the full text
-                projects.append(full_text)
-                return projects
+            # Text read in the browser needs no parsing
+            text = self._section_text('projects')
+            if text is not None:
+                return [text] if text else []
+            # Try to get from memory first
+            if 'projects_expanded_html' in self.html_content_dict:
+                scraper = ProjectScraper(html_content=self.html_content_dict['projects_expanded_html'])
+                return scraper.scrape_projects()
+            # Fall back to file if session directory is provided
+            if self.session_dir:
+                proj_file = os.path.join(self.session_dir, 'projects_expanded_html.txt')
+                if os.path.exists(proj_file):
+                    scraper = ProjectScraper(proj_file)
+                    return scraper.scrape_projects()
+        except Exception:
+            logger.exception("Error expanding projects")
         
-        return projects
+        return self._uncaptured('projects')
         
     def extract_companies(self):
         """Extract company information from the about pages."""
@@ -313,11 +378,13 @@ class LinkedInProfileScraper:
             # First check if we have company HTML content in memory
             if self.html_content_dict:
                 # Look only for the 'best' company HTML content (not *_main_html or *_about_html)
-                company_keys = [k for k in self.html_content_dict.keys() 
-                               if k.startswith('company_') and k.endswith('_html') 
-                               and not k.endswith('_main_html') and not k.endswith('_about_html')]
-                
+                company_keys = [k for k in self.html_content_dict
+                               if k.startswith('company_') and k.endswith('_html')
+                               and not k.endswith(_PARTIAL_COMPANY_SUFFIXES)]
+        
                 if company_keys:
+                    from .about_scraper import process_about_file
+                    
                     # Process each unique company only once
                     processed_companies = set()
                     
@@ -329,8 +396,8 @@ class LinkedInProfileScraper:
                             if company_info and company_info['name'] and company_info['name'] not in processed_companies:
                                 companies.append(company_info)
                                 processed_companies.add(company_info['name'])
-                        except Exception as e:
-                            print(f"Error processing company content from {key}: {e}")
+                        except Exception:
+                            logger.exception("Error processing company content from %s", key)
                     
                     return companies
             
@@ -338,118 +405,132 @@ class LinkedInProfileScraper:
             if self.session_dir:
                 company_dir = os.path.join(self.session_dir, 'company_about_pages')
                 if os.path.exists(company_dir):
-                    about_files = [f for f in os.listdir(company_dir) if f.endswith('_about.txt')]
-                    for file_name in about_files:
-                        try:
-                            file_path = os.path.join(company_dir, file_name)
-                            company_info = process_about_file(file_path)
-                            if company_info:
-                                companies.append(company_info)
-                        except Exception as e:
-                            print(f"Error processing company file {file_name}: {e}")
-                    return companies
+                    return self._process_about_dir(company_dir)
             
             # Legacy path as last resort
-            about_dir = Path(os.path.dirname(os.path.abspath(__file__))) / 'html_pages' / 'company_about_pages'
-            if about_dir.exists():
-                about_files = list(about_dir.glob('*_about.txt'))
-                for file_path in about_files:
-                    try:
-                        company_info = process_about_file(file_path)
-                        if company_info:
-                            companies.append(company_info)
-                    except Exception as e:
-                        print(f"Error processing company file {file_path}: {e}")
+            about_dir = _MODULE_DIR / 'html_pages' / 'company_about_pages'
+            if os.path.exists(about_dir):
+                return self._process_about_dir(about_dir)
             
             return companies
             
-        except Exception as e:
-            print(f"Error extracting companies: {e}")
+        except Exception:
+            logger.exception("Error extracting companies")
             return []
             
+    @staticmethod
+    def _process_about_dir(about_dir):
+        """
+        Extract company information from every *_about.txt file in a directory.
+        
+        The files are independent, so they are parsed on a small thread pool.
+        
+        Args:
+            about_dir (str): Directory containing the company about pages
+            
+        Returns:
+            list: Company information dicts in directory order, one per company name
+        """
+        from .about_scraper import process_about_file
+        
+        with os.scandir(about_dir) as entries:
+            about_files = [entry.path for entry in entries if entry.name.endswith('_about.txt')]
+        
+        companies = []
+        processed_companies = set()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for company_info in executor.map(process_about_file, about_files):
+                if not company_info:
+                    continue
+                # Skip repeated pages of a company that was already processed
+                if company_info['name']:
+                    if company_info['name'] in processed_companies:
+                        continue
+                    processed_companies.add(company_info['name'])
+                companies.append(company_info)
+        
+        return companies
+    
     def extract_about(self):
         """Extract the 'About' section from LinkedIn profile."""
-        # Find the div with id="about" which is the anchor for the About section
-        about_anchor = self.soup.find('div', id='about')
-        if not about_anchor:
-            return None
-            
-        # Find the parent container that has the actual content
-        parent_container = about_anchor.find_next_sibling('div', class_=re.compile(r'.*escTwakvXlHtkbumLjULwyNILFHqFbANpitf'))
-        if not parent_container:
-            return None
-            
-        # Find the content div with the about text - it's in a sibling div of the parent container
-        content_div = parent_container.find_next_sibling('div', class_='display-flex ph5 pv3')
-        if not content_div:
-            return None
-            
-        # Find the div with the actual text content
-        text_div = content_div.find('div', class_=re.compile(r'.*inline-show-more-text.*'))
-        if not text_div:
-            return None
-            
-        # Extract text from both visible and hidden spans
-        visible_text = ''
-        hidden_text = ''
+        for selector in _ABOUT_TEXT_SELECTORS:
+            node = self._query_one(selector)
+            if node is not None:
+                # Collapse whitespace and clean up any leftover HTML entities
+                text = ' '.join(self._string(node, ' ').split()).replace('&amp;', '&')
+                if text:
+                    return text
+        return None
+
+    async def scrape_profile(self):
+        """
+        Compile all profile information.
         
-        # Get visible text (aria-hidden="true")
-        visible_span = text_div.find('span', {'aria-hidden': 'true'})
-        if visible_span:
-            # Clean up the text by removing HTML comments and extra whitespace
-            visible_text = ' '.join(visible_span.stripped_strings)
+        The profile page is parsed in the default thread pool executor, and
+        then the extractors, which parse their expanded pages independently,
+        run there concurrently, so none of the parsing blocks the event loop.
         
-        # Get hidden text (visually-hidden)
-        hidden_span = text_div.find('span', class_='visually-hidden')
-        if hidden_span:
-            hidden_text = ' '.join(hidden_span.stripped_strings)
+        Returns:
+            dict: The compiled profile data. A section whose "Show all" page was
+            not captured is None, and a missing one is an empty list.
+        """
+        loop = asyncio.get_running_loop()
         
-        # Clean up any HTML entities and extra whitespace
-        def clean_text(text):
-            if not text:
-                return None
-            # Replace HTML entities and clean up whitespace
-            text = text.replace('&amp;', '&')
-            text = ' '.join(text.split())
-            return text.strip()
+        # Parse and bucket the profile cards up front so the extractors only read the cache
+        await loop.run_in_executor(None, self._bucket_sections)
+        
+        extractors = (
+            self.extract_name,
+            self.extract_headline,
+            self.extract_about,
+            self.extract_experiences,
+            self.extract_education,
+            self.extract_skills,
+            self.extract_languages,
+            self.extract_licenses_certifications,
+            self.extract_projects,
+            self.extract_companies,
+        )
+        (name, headline, about, experiences, education, skills, languages,
+         licenses, projects, companies) = await asyncio.gather(
+            *(loop.run_in_executor(None, extract) for extract in extractors)
+        )
         
-        # Return the non-empty text, preferring visible text if both exist
-        result = clean_text(visible_text) or clean_text(hidden_text)
-        return result if result else None
-
-    def scrape_profile(self):
-        """Compile all profile information."""
         profile = {
-            'name': self.extract_name(),
-            'headline': self.extract_headline(),
-            'about': self.extract_about(),
-            'experiences': self.extract_experiences(),
-            'education': self.extract_education(),
-            'skills': self.extract_skills(),
-            'languages': self.extract_languages(),
-            'licenses-certifications': self.extract_licenses_certifications(),
-            'projects': self.extract_projects(),
-            'current_companies': self.extract_companies()
+            'name': name,
+            'headline': headline,
+            'about': about,
+            'experiences': experiences,
+            'education': education,
+            'skills': skills,
+            'languages': languages,
+            'licenses-certifications': licenses,
+            'projects': projects,
+            'current_companies': companies
         }
         return profile
 
 def main():
     # Path to the HTML file
-    html_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'html_pages', 'profile_html.txt')
+    html_file = _MODULE_DIR / 'html_pages' / 'profile_html.txt'
 
     
     # Create scraper instance
     scraper = LinkedInProfileScraper(html_file)
     
     # Scrape profile
-    profile = scraper.scrape_profile()
+    profile = asyncio.run(scraper.scrape_profile())
     
     # Print or save the profile
     print(json.dumps(profile, indent=2))
     
     # Optionally, save to a JSON file
-    with open('/Users/neerajmenon/Documents/Projects/3R/MCP/sales_mcp/linkedin_profile.json', 'w') as f:
-        json.dump(profile, f, indent=2)
+    output_file = '/Users/neerajmenon/Documents/Projects/3R/MCP/sales_mcp/linkedin_profile.json'
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(profile, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(profile, f, indent=2)
 
 if __name__ == '__main__':
     main()
@@ -1,10 +1,13 @@
 import asyncio
+import gzip
 import os
 import random
 import logging
-from typing import Optional, List, Dict, Tuple
+import time
+from collections.abc import MutableMapping
+from typing import Optional, List, Dict, Iterator, Tuple
 
-from playwright.async_api import Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
 from .authenticator import LinkedinAuthenticator
 # from .extractors import ProfileExtractor
@@ -14,7 +17,186 @@ from .extract_current_companies import extract_current_companies
 # Setup logger for this module
 logger = logging.getLogger(__name__)
 
+# Profile sections with a "Show all" page, captured as '{section}_expanded_html',
+# or as '{section}_text' for those in _TEXT_ONLY_SECTIONS
+_EXPANDABLE_SECTIONS = (
+    'experiences',
+    'skills',
+    'education',
+    'languages',
+    'projects',
+    'licenses_and_certifications',
+)
+
+# Elements that show a page has rendered, waited for instead of fixed sleeps
+_PROFILE_READY_SELECTORS = ('h1[class*="text-heading-xlarge"]', 'section[class*="pv-profile-card"]')
+_SECTION_READY_SELECTORS = {
+    'experiences': ('main[aria-label="Experience"]',),
+    'skills': ('main[aria-label="Skills"]',),
+    'education': ('main[aria-label="Education"]',),
+    'languages': ('main[aria-label="Languages"]', 'main[aria-label="Language"]'),
+    'projects': ('main[aria-label="Projects"]',),
+    'licenses_and_certifications': (
+        'main[aria-label="Licenses & certifications"]',
+        'main[aria-label="Licenses & Certifications"]',
+        'main[aria-label="Licenses"]',
+    ),
+}
+# Sections only ever read as plain text, mapped to the aria-label of their <main>.
+# Their text is read in the browser instead of serializing the whole page.
+_TEXT_ONLY_SECTIONS = {
+    'skills': 'Skills',
+    'projects': 'Projects',
+}
+
+# Reads a <main> element's rendered text, or '' if the page has none
+_MAIN_TEXT_JS = """label => {
+    const main = document.querySelector(`main[aria-label="${label}"]`);
+    return main ? main.innerText : '';
+}"""
+
+# Response statuses LinkedIn uses to throttle scrapers, and the backoff bounds
+# in seconds applied between company scrapes once one is seen
+_RATE_LIMIT_STATUSES = frozenset((429, 999))
+_MIN_COMPANY_BACKOFF = 0.5
+_MAX_COMPANY_BACKOFF = 8.0
+
+_COMPANY_READY_SELECTORS = ('div.org-page-navigation', 'nav.org-page-navigation', 'h1.org-top-card-summary__title')
+_COMPANY_ABOUT_READY_SELECTORS = (
+    'section.org-about-module',
+    '[data-test-id="about-us"]',
+    'dl',
+    'p.break-words.white-space-pre-wrap',
+    'div.org-about-module__description',
+)
+
+
+class CompressedHTMLStore(MutableMapping):
+    """
+    Dict-like store of captured HTML pages, kept gzip-compressed in memory
+    
+    Pages are compressed when stored and decompressed each time they are read,
+    so a profile's dozens of multi-MB pages take a fraction of the memory.
+    """
+    
+    def __init__(self):
+        self._pages: Dict[str, bytes] = {}
+    
+    def __getitem__(self, key: str) -> str:
+        return gzip.decompress(self._pages[key]).decode('utf-8')
+    
+    def __setitem__(self, key: str, html: str):
+        # Level 1 compresses fast enough to be negligible next to page loads
+        self._pages[key] = gzip.compress(html.encode('utf-8'), compresslevel=1)
+    
+    def __delitem__(self, key: str):
+        del self._pages[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pages)
+    
+    def __len__(self) -> int:
+        return len(self._pages)
+    
+    def __contains__(self, key) -> bool:
+        # Skip the decompression MutableMapping's default would do
+        return key in self._pages
+    
+    def alias(self, key: str, existing_key: str):
+        """Store the page under existing_key under key too, sharing its compressed bytes."""
+        self._pages[key] = self._pages[existing_key]
+    
+    def merge(self, other: 'CompressedHTMLStore', prefix: str = ''):
+        """Copy the pages of another store, with prefix added to their keys, without recompressing."""
+        for key, data in other._pages.items():
+            self._pages[prefix + key] = data
+
+
+def _company_concurrency() -> int:
+    """
+    Read how many company pages may be open at once from LI_COMPANY_CONCURRENCY
+    
+    Returns:
+        int: The configured value, or 6 if it is unset or not an integer, and at least 1
+    """
+    value = os.environ.get('LI_COMPANY_CONCURRENCY', '6')
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid LI_COMPANY_CONCURRENCY={value!r}, using 6")
+        return 6
+
+
+def _company_slug(company_url: str) -> str:
+    """Normalize a company URL to its lowercase /company/<slug>, or return it as is."""
+    if '/company/' not in company_url:
+        return company_url
+    return company_url.split('/company/')[1].split('/')[0].split('?')[0].lower()
+
+
+def _write_text(path: str, text: str):
+    """Write text to a file as UTF-8."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+async def _save_debug_html(path: str, html: str):
+    """
+    Save captured HTML for debugging without blocking the event loop
+    
+    Args:
+        path (str): File to write
+        html (str): HTML content to save
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, _write_text, path, html)
+
+
+async def _extract_section_text(page: Page, aria_label: str) -> str:
+    """
+    Read the text of a <main> section inside the browser
+    
+    Only the text crosses over from the browser, instead of the full page HTML.
+    
+    Args:
+        page (Page): Playwright page object
+        aria_label (str): aria-label of the <main> element, e.g. 'Skills'
+        
+    Returns:
+        str: The section's non-empty lines joined with ' | ', like the section
+        scrapers' output, or '' if the section is missing
+    """
+    text = await page.evaluate(_MAIN_TEXT_JS, aria_label)
+    return ' | '.join(line.strip() for line in text.splitlines() if line.strip())
+
+
+async def _smart_wait(page: Page, selectors, timeout: float = 20000):
+    """
+    Wait until any of the selectors is visible, then pause briefly
+    
+    Resolves as soon as the content is rendered instead of sleeping for a
+    fixed time. Navigations only wait for the response to commit, so this
+    is what actually waits for the page to load. The short random pause
+    afterwards keeps a human-like cadence. A timeout is logged and ignored,
+    so the caller captures what has loaded.
+    
+    Args:
+        page (Page): Playwright page object
+        selectors: CSS selectors to wait for, any one of which is enough
+        timeout (float): Maximum wait in milliseconds
+    """
+    try:
+        await page.wait_for_selector(', '.join(selectors), state='visible', timeout=timeout)
+    except Exception as e:
+        logger.info(f"Timed out waiting for {selectors}: {e}")
+    await page.wait_for_timeout(random.uniform(200, 600))
+
+
 class LinkedinProfileScraper:
+    # Company pages already captured in this process, shared by all scrapers,
+    # as company slug -> (capture time, pages keyed without the company_{i}_ prefix)
+    _company_cache: Dict[str, Tuple[float, CompressedHTMLStore]] = {}
+    
     def __init__(self, debug_mode=False):
         """
         Initialize the LinkedIn profile scraper.
@@ -24,8 +206,24 @@ class LinkedinProfileScraper:
         """
         self.debug_mode = debug_mode
         
-        # Store HTML content in memory
-        self.html_content = {}
+        # Store HTML content in memory, compressed
+        self.html_content = CompressedHTMLStore()
+        
+        # Logged-in (browser, context, page), kept open between profiles until close(),
+        # and the Playwright driver the browser was launched from
+        self._session = None
+        self._playwright = None
+        
+        # Rate-limit state shared by all company tasks: the current backoff in
+        # seconds, the monotonic time company scrapes may resume at, and the
+        # number of clean loads since the last rate-limit response
+        self._company_backoff = 0.0
+        self._company_resume_at = 0.0
+        self._clean_company_loads = 0
+        
+        # Clean loads in a row needed to drop the backoff: one full round of
+        # concurrent company pages, so a single lucky load does not reset it
+        self._clean_loads_to_reset = _company_concurrency()
         
         # Only create debug directory if in debug mode
         if self.debug_mode:
@@ -36,27 +234,24 @@ class LinkedinProfileScraper:
             # Ensure html_pages directory exists
             os.makedirs(self.html_pages_dir, exist_ok=True)
     
-    async def scrape_profile(
-        self, 
-        profile_url: str, 
-        email: Optional[str] = None, 
-        password: Optional[str] = None,
-        scrape_companies: bool = True
-    ) -> Tuple[bool, Dict[str, str]]:
+    async def open(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None
+    ) -> 'LinkedinProfileScraper':
         """
-        Comprehensive LinkedIn profile scraping method
+        Launch the browser and log in, unless a session is already open
         
+        Args:
+            email (str, optional): LinkedIn login email. Defaults to LINKEDIN_EMAIL.
+            password (str, optional): LinkedIn login password. Defaults to LINKEDIN_PASSWORD.
+            
         Returns:
-            Tuple[bool, Dict[str, str]]: (success, html_content_dict)
+            LinkedinProfileScraper: This scraper, for chaining
         """
-        # Setup basic console logging
-        logging.basicConfig(
-            level=logging.INFO, 
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler()]
-        )
-        logger = logging.getLogger(__name__)
-
+        if self._session is not None:
+            return self
+        
         # Retrieve credentials from environment if not provided
         if not email:
             email = os.environ.get('LINKEDIN_EMAIL')
@@ -71,17 +266,59 @@ class LinkedinProfileScraper:
                 "or through LINKEDIN_EMAIL and LINKEDIN_PASSWORD environment variables"
             )
         
+        # Start the Playwright driver, kept so close() can stop it
+        self._playwright = await async_playwright().start()
+        
         # Launch browser and authenticate
-        browser, context, page = await LinkedinAuthenticator.login(email, password)
+        try:
+            self._session = await LinkedinAuthenticator.login(email, password, playwright=self._playwright)
+        except Exception:
+            await self._stop_playwright()
+            raise
+        return self
+    
+    async def __aenter__(self) -> 'LinkedinProfileScraper':
+        return await self.open()
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def scrape_profile(
+        self, 
+        profile_url: str, 
+        email: Optional[str] = None, 
+        password: Optional[str] = None,
+        scrape_companies: bool = True
+    ) -> Tuple[bool, 'CompressedHTMLStore']:
+        """
+        Comprehensive LinkedIn profile scraping method
+        
+        Logs in with open() on the first call unless a session is already open,
+        and reuses the session for later calls. Call close() once done, or use
+        the scraper as an async context manager:
+        
+            async with LinkedinProfileScraper() as scraper:
+                for url in urls:
+                    success, html_content = await scraper.scrape_profile(url)
+        
+        Returns:
+            Tuple[bool, CompressedHTMLStore]: (success, html_content_dict), where
+            html_content_dict decompresses each page when it is read
+        """
+        await self.open(email, password)
+        browser, context, page = self._session
+        
+        # Start a fresh store so the one returned for a previous profile is left intact
+        self.html_content = CompressedHTMLStore()
         
         try:
             logger.info(f"Navigating to profile: {profile_url}")
             
             # Navigate to profile with advanced waiting
-            await page.goto(profile_url, wait_until='domcontentloaded', timeout=45000)
+            await page.goto(profile_url, wait_until='commit', timeout=20000)
             
-            # Random wait to simulate human behavior
-            await page.wait_for_timeout(random.uniform(2000, 5000))
+            # Wait for the profile to render
+            await _smart_wait(page, _PROFILE_READY_SELECTORS)
             
             # Extract page HTML
             profile_html = await page.content()
@@ -92,16 +329,17 @@ class LinkedinProfileScraper:
             # Save HTML to file only in debug mode
             if self.debug_mode:
                 profile_html_path = os.path.join(self.html_pages_dir, 'profile_html.txt')
-                with open(profile_html_path, 'w', encoding='utf-8') as f:
-                    f.write(profile_html)
+                await _save_debug_html(profile_html_path, profile_html)
             
-            # Attempt to expand and capture additional sections
-            await self._expand_and_capture_section(page, 'experiences')
-            await self._expand_and_capture_section(page, 'skills')
-            await self._expand_and_capture_section(page, 'education')
-            await self._expand_and_capture_section(page, 'languages')
-            await self._expand_and_capture_section(page, 'projects')
-            await self._expand_and_capture_section(page, 'licenses_and_certifications')
+            # Attempt to expand and capture additional sections, each on its own page
+            expanded = await asyncio.gather(*(
+                self._expand_section_on_new_page(context, profile_url, section)
+                for section in _EXPANDABLE_SECTIONS
+            ))
+            for section, expanded_html in zip(_EXPANDABLE_SECTIONS, expanded):
+                if expanded_html is not None:
+                    key = f'{section}_text' if section in _TEXT_ONLY_SECTIONS else f'{section}_expanded_html'
+                    self.html_content[key] = expanded_html
             
             logger.info("Profile HTML captured successfully")
 
@@ -111,11 +349,7 @@ class LinkedinProfileScraper:
             # Scrape company about pages if requested
             if scrape_companies:
                 logger.info("Scraping company about pages")
-                await self.scrape_company_about_pages(browser, context, page)
-            
-            # Close browser resources
-            await context.close()
-            await browser.close()
+                await self.scrape_company_about_pages(browser, context)
             
             return True, self.html_content
         
@@ -123,13 +357,41 @@ class LinkedinProfileScraper:
             logger.error(f"Profile scraping failed: {e}")
             raise
         
-    async def _expand_and_capture_section(self, page: Page, section: str):
+    async def _expand_section_on_new_page(
+        self,
+        context: BrowserContext,
+        profile_url: str,
+        section: str
+    ) -> Optional[str]:
+        """
+        Open the profile on a new page and capture one expanded section there
+        
+        Returns:
+            Optional[str]: The expanded section HTML, or None if it could not be captured
+        """
+        page = await context.new_page()
         try:
-            # Wait for the page to be visually stable
-            await page.wait_for_load_state('domcontentloaded', timeout=10000)
-            
-            # Wait a bit longer to ensure dynamic content is loaded
-            await page.wait_for_timeout(random.uniform(3000, 5000))
+            await page.goto(profile_url, wait_until='commit', timeout=20000)
+            return await self._expand_and_capture_section(page, section)
+        except Exception as e:
+            logger.error(f"Error expanding {section} section: {e}")
+            return None
+        finally:
+            await page.close()
+    
+    async def _expand_and_capture_section(self, page: Page, section: str) -> Optional[str]:
+        """
+        Follow a section's "Show all" link on the given page and capture the result
+        
+        The page is left on the expanded section, so callers use a page of their own.
+        
+        Returns:
+            Optional[str]: The expanded section HTML, or just its text for sections in
+            _TEXT_ONLY_SECTIONS, or None if it could not be captured
+        """
+        try:
+            # Wait for the profile cards to render
+            await _smart_wait(page, _PROFILE_READY_SELECTORS)
             
             # Define selectors for different sections with exact IDs when possible
             section_selectors = {
@@ -166,53 +428,57 @@ class LinkedinProfileScraper:
             # Check if section selector exists
             selectors = section_selectors.get(section, [])
             
-            # Try each selector
-            for selector in selectors:
-                # Log the exact selector being used
-                logger.info(f"Attempting to find '{section}' expansion button with selector: {selector}")
+            # Combine the CSS and XPath candidates so a single wait covers them all
+            css_selector = ', '.join(sel for sel in selectors if not sel.startswith('//'))
+            xpath_selector = ' | '.join(sel for sel in selectors if sel.startswith('//'))
+            button = page.locator(css_selector).or_(page.locator(f"xpath={xpath_selector}")).first
+            
+            # Log the exact selectors being used
+            logger.info(f"Attempting to find '{section}' expansion button with selectors: {selectors}")
+            
+            try:
+                # Wait for any of the candidates to be visible with a timeout
+                await button.wait_for(state='visible', timeout=5000)
+                logger.info(f"Found '{section}' expansion button")
                 
-                try:
-                    # Wait for the selector to be visible with a timeout
-                    await page.wait_for_selector(selector, state='visible', timeout=5000)
-                    logger.info(f"Found '{section}' expansion button with selector: {selector}")
+                # Get the button's href
+                href = await button.get_attribute('href')
+                
+                if href:
+                    # Navigate to the full section page
+                    logger.info(f"Navigating to full {section} section: {href}")
+                    await page.goto(href, wait_until='commit', timeout=20000)
                     
-                    # Get the button and its href
-                    button = page.locator(selector).first
-                    href = await button.get_attribute('href')
+                    # Wait for the expanded section to render
+                    await _smart_wait(page, _SECTION_READY_SELECTORS[section])
                     
-                    if href:
-                        # Navigate to the full section page
-                        logger.info(f"Navigating to full {section} section: {href}")
-                        await page.goto(href, wait_until='domcontentloaded', timeout=30000)
-                        
-                        # Wait for the page to be visually stable
-                        await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                        await page.wait_for_timeout(random.uniform(3000, 5000))
-                        
-                        # Capture expanded section HTML
-                        expanded_html = await page.content()
+                    # Text-only sections are read in the browser, skipping page.content()
+                    if section in _TEXT_ONLY_SECTIONS:
+                        section_text = await _extract_section_text(page, _TEXT_ONLY_SECTIONS[section])
                         
-                        # Store HTML in memory
-                        self.html_content[f'{section}_expanded_html'] = expanded_html
-                        
-                        # Save expanded section HTML only in debug mode
+                        # Save section text only in debug mode
                         if self.debug_mode:
-                            section_html_path = os.path.join(self.html_pages_dir, f'{section}_expanded_html.txt')
-                            with open(section_html_path, 'w', encoding='utf-8') as f:
-                                f.write(expanded_html)
-                        
-                        # Go back to the original profile page
-                        await page.go_back(wait_until='domcontentloaded', timeout=30000)
-                        await page.wait_for_timeout(random.uniform(3000, 5000))
+                            section_text_path = os.path.join(self.html_pages_dir, f'{section}_text.txt')
+                            await _save_debug_html(section_text_path, section_text)
                         
-                        logger.info(f"Expanded {section} section HTML captured")
-                        return
-                    else:
-                        logger.info(f"Found '{section}' button but no href attribute")
-                        
-                except Exception as e:
-                    logger.info(f"Selector '{selector}' not found or timed out: {e}")
-                    continue
+                        logger.info(f"Expanded {section} section text captured")
+                        return section_text
+                    
+                    # Capture expanded section HTML
+                    expanded_html = await page.content()
+                    
+                    # Save expanded section HTML only in debug mode
+                    if self.debug_mode:
+                        section_html_path = os.path.join(self.html_pages_dir, f'{section}_expanded_html.txt')
+                        await _save_debug_html(section_html_path, expanded_html)
+                    
+                    logger.info(f"Expanded {section} section HTML captured")
+                    return expanded_html
+                else:
+                    logger.info(f"Found '{section}' button but no href attribute")
+                    
+            except Exception as e:
+                logger.info(f"'{section}' expansion button not found or timed out: {e}")
             
             # If no buttons found after trying all selectors
             logger.info(f"No '{section}' expansion button found")
@@ -222,24 +488,36 @@ class LinkedinProfileScraper:
         
         except Exception as ex:
             logger.error(f"Error expanding {section} section: {ex}")
+        
+        return None
             
-    async def scrape_company_about_pages(self, browser: Browser, context: BrowserContext, page: Page):
+    async def scrape_company_about_pages(self, browser: Browser, context: BrowserContext):
         """
         Scrape about pages for companies listed in the profile's experience section
+        
+        Companies are scraped concurrently, each on its own page, with at most
+        LI_COMPANY_CONCURRENCY (default 6) pages open at a time.
         """
         try:
             # Extract current companies from the profile
             # Check if we have experiences_expanded_html in memory
             if 'experiences_expanded_html' in self.html_content:
-                company_urls = extract_current_companies(self.html_content.get('experiences_expanded_html', ''))
+                source_html = self.html_content.get('experiences_expanded_html', '')
             else:
                 # Fall back to profile HTML if experiences section isn't expanded
-                company_urls = extract_current_companies(self.html_content.get('profile_html', ''))
+                source_html = self.html_content.get('profile_html', '')
+            
+            # Parse in a worker thread so other scrapes' page I/O keeps running
+            loop = asyncio.get_running_loop()
+            company_urls = await loop.run_in_executor(None, extract_current_companies, source_html)
             
             if not company_urls:
                 logger.info("No company URLs found to scrape")
                 return
             
+            # Visit each company once, even if several URLs point at it
+            company_urls = list({_company_slug(url): url for url in company_urls}.values())
+            
             logger.info(f"Found {len(company_urls)} company URLs to scrape")
             
             # Create a directory for company about pages if in debug mode
@@ -248,128 +526,244 @@ class LinkedinProfileScraper:
                 company_pages_dir = os.path.join(self.html_pages_dir, 'company_about_pages')
                 os.makedirs(company_pages_dir, exist_ok=True)
             
-            # Visit each company page and extract the about page
-            for i, company_url in enumerate(company_urls):
-                try:
-                    logger.info(f"Processing company {i+1}/{len(company_urls)}: {company_url}")
-                    
-                    # Extract company name from URL for better identification
-                    company_name = "unknown_company"
-                    if '/company/' in company_url:
-                        company_name = company_url.split('/company/')[1].split('/')[0]
-                    
-                    # Navigate to the company page
-                    await page.goto(company_url, wait_until='domcontentloaded', timeout=45000)
-                    await page.wait_for_timeout(random.uniform(3000, 5000))
-                    
-                    # First get the main company page HTML
-                    main_company_html = await page.content()
-                    
-                    # Store main company page HTML in memory
-                    self.html_content[f'company_{i}_main_html'] = main_company_html
-                    
-                    # Save main company page HTML only in debug mode
-                    if self.debug_mode and company_pages_dir:
-                        main_html_path = os.path.join(company_pages_dir, f'{company_name}_main.txt')
-                        with open(main_html_path, 'w', encoding='utf-8') as f:
-                            f.write(main_company_html)
-                    
-                    # Try to find and navigate to the About page using multiple selectors
-                    about_url = None
-                    about_selectors = [
-                        'a.org-page-navigation__item-anchor:has-text("About")',
-                        'a[href*="/about/"]:has-text("About")',
-                        'a[href*="/about"]',
-                        '//a[contains(@href, "/about") and contains(text(), "About")]',
-                        'a.ember-view[href*="about"]'
-                    ]
-                    
-                    for selector in about_selectors:
-                        try:
-                            logger.info(f"Looking for About link with selector: {selector}")
-                            about_element = None
-                            
-                            # Try different methods to find the element
-                            if selector.startswith('//'):
-                                # XPath selector
-                                about_element = await page.query_selector_all(f"xpath={selector}")
-                                if about_element and len(about_element) > 0:
-                                    about_element = about_element[0]
-                            else:
-                                # CSS selector
-                                about_element = await page.query_selector(selector)
-                            
-                            if about_element:
-                                about_href = await about_element.get_attribute('href')
-                                if about_href:
-                                    if not about_href.startswith('http'):
-                                        about_url = f"https://www.linkedin.com{about_href}"
-                                    else:
-                                        about_url = about_href
-                                    logger.info(f"Found About link: {about_url}")
-                                    break
-                        except Exception as e:
-                            logger.debug(f"Selector '{selector}' not found or error: {e}")
-                    
-                    # If we couldn't find the about link, try to construct it
-                    if not about_url and '/company/' in company_url:
-                        # Construct the about URL by appending /about to the company URL
-                        base_url = company_url.split('?')[0].rstrip('/')
-                        about_url = f"{base_url}/about/"
-                        logger.info(f"Constructed About URL: {about_url}")
-                    
-                    # Navigate to the about page if we have a URL
-                    about_html = None
-                    if about_url:
-                        try:
-                            logger.info(f"Navigating to About page: {about_url}")
-                            await page.goto(about_url, wait_until='domcontentloaded', timeout=45000)
-                            await page.wait_for_timeout(random.uniform(3000, 5000))
-                            
-                            # Get the about page HTML
-                            about_html = await page.content()
-                            
-                            # Store about page HTML in memory
-                            self.html_content[f'company_{i}_about_html'] = about_html
-                            
-                            # Save about page HTML only in debug mode
-                            if self.debug_mode and company_pages_dir:
-                                about_html_path = os.path.join(company_pages_dir, f'{company_name}_about.txt')
-                                with open(about_html_path, 'w', encoding='utf-8') as f:
-                                    f.write(about_html)
-                        except Exception as e:
-                            logger.warning(f"Error navigating to About page: {e}")
-                    
-                    # Store the best HTML content for company info extraction
-                    # Prioritize about page HTML if available, otherwise use main page
-                    if about_html:
-                        self.html_content[f'company_{i}_html'] = about_html
-                    else:
-                        self.html_content[f'company_{i}_html'] = main_company_html
-                        logger.warning(f"Using main company page for {company_name} as About page not available")
-                    
-                    logger.info(f"Company {i+1} HTML captured successfully")
-                    
-                    # Add a delay between company scrapes to avoid rate limiting
-                    await page.wait_for_timeout(random.uniform(2000, 4000))
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping company {i+1}: {e}")
+            # Visit the company pages concurrently, a bounded number at a time
+            concurrency = _company_concurrency()
+            sem = asyncio.Semaphore(concurrency)
+            self._clean_loads_to_reset = concurrency
+            results = await asyncio.gather(*(
+                self._scrape_one_company(i, company_url, len(company_urls), sem, context, company_pages_dir)
+                for i, company_url in enumerate(company_urls)
+            ), return_exceptions=True)
+            
+            # Merge each company's pages in order once all tasks are done
+            for i, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error scraping company {i+1}: {result}")
+                else:
+                    self.html_content.merge(result, prefix=f'company_{i}_')
             
             logger.info("Finished scraping company about pages")
             
         except Exception as e:
             logger.error(f"Error in scrape_company_about_pages: {e}")
+    
+    async def _scrape_one_company(
+        self,
+        i: int,
+        company_url: str,
+        total: int,
+        sem: asyncio.Semaphore,
+        context: BrowserContext,
+        company_pages_dir: Optional[str]
+    ) -> CompressedHTMLStore:
+        """
+        Capture the main and about pages of one company on a page of its own
+        
+        Complete captures from the last LI_COMPANY_CACHE_TTL seconds (default 3600),
+        e.g. for an employer shared by several profiles in a batch, are reused
+        without visiting the company again.
+        
+        Returns:
+            CompressedHTMLStore: The company's pages, keyed by what follows company_{i}_
+            in html_content, i.e. 'main_html', 'about_html' and 'html'
+        """
+        slug = _company_slug(company_url)
+        
+        # Reuse a recent capture of the same company, and drop an expired one
+        cache_ttl = float(os.environ.get('LI_COMPANY_CACHE_TTL', '3600'))
+        cached = self._company_cache.get(slug)
+        if cached is not None:
+            captured_at, pages = cached
+            if time.monotonic() - captured_at < cache_ttl:
+                logger.info(f"Using cached pages for company {i+1}/{total}: {company_url}")
+                return pages
+            self._company_cache.pop(slug, None)
+        
+        # Compressed as soon as each page is captured
+        html_content = CompressedHTMLStore()
+        
+        # Every task waits out a rate-limit pause before taking a slot
+        await self._wait_out_rate_limit()
+        async with sem:
+            # The pause may have started while this task was queued for a slot
+            await self._wait_out_rate_limit()
+            page = await context.new_page()
             
-        except Exception as e:
-            logger.error(f"Error in scrape_company_about_pages: {e}")
+            # Note any rate-limit response while this company's pages load
+            rate_limited = []
+            
+            def on_response(response):
+                if response.status in _RATE_LIMIT_STATUSES:
+                    rate_limited.append(response.url)
+            
+            page.on('response', on_response)
+            try:
+                logger.info(f"Processing company {i+1}/{total}: {company_url}")
+                
+                # Extract company name from URL for better identification
+                company_name = "unknown_company"
+                if '/company/' in company_url:
+                    company_name = company_url.split('/company/')[1].split('/')[0]
+                
+                # Navigate to the company page
+                await page.goto(company_url, wait_until='commit', timeout=20000)
+                await _smart_wait(page, _COMPANY_READY_SELECTORS)
+                
+                # First get the main company page HTML
+                main_company_html = await page.content()
+                
+                # Store main company page HTML in memory
+                html_content['main_html'] = main_company_html
+                
+                # Save main company page HTML only in debug mode
+                if self.debug_mode and company_pages_dir:
+                    main_html_path = os.path.join(company_pages_dir, f'{company_name}_main.txt')
+                    await _save_debug_html(main_html_path, main_company_html)
+                
+                # Try to find and navigate to the About page using multiple selectors
+                about_url = None
+                about_selectors = [
+                    'a.org-page-navigation__item-anchor:has-text("About")',
+                    'a[href*="/about/"]:has-text("About")',
+                    'a[href*="/about"]',
+                    '//a[contains(@href, "/about") and contains(text(), "About")]',
+                    'a.ember-view[href*="about"]'
+                ]
+                
+                for selector in about_selectors:
+                    try:
+                        logger.info(f"Looking for About link with selector: {selector}")
+                        about_element = None
+                        
+                        # Try different methods to find the element
+                        if selector.startswith('//'):
+                            # XPath selector
+                            about_element = await page.query_selector_all(f"xpath={selector}")
+                            if about_element and len(about_element) > 0:
+                                about_element = about_element[0]
+                        else:
+                            # CSS selector
+                            about_element = await page.query_selector(selector)
+                        
+                        if about_element:
+                            about_href = await about_element.get_attribute('href')
+                            if about_href:
+                                if not about_href.startswith('http'):
+                                    about_url = f"https://www.linkedin.com{about_href}"
+                                else:
+                                    about_url = about_href
+                                logger.info(f"Found About link: {about_url}")
+                                break
+                    except Exception as e:
+                        logger.debug(f"Selector '{selector}' not found or error: {e}")
+                
+                # If we couldn't find the about link, try to construct it
+                if not about_url and '/company/' in company_url:
+                    # Construct the about URL by appending /about to the company URL
+                    base_url = company_url.split('?')[0].rstrip('/')
+                    about_url = f"{base_url}/about/"
+                    logger.info(f"Constructed About URL: {about_url}")
+                
+                # Navigate to the about page if we have a URL
+                about_html = None
+                if about_url:
+                    try:
+                        logger.info(f"Navigating to About page: {about_url}")
+                        await page.goto(about_url, wait_until='commit', timeout=20000)
+                        await _smart_wait(page, _COMPANY_ABOUT_READY_SELECTORS)
+                        
+                        # Get the about page HTML
+                        about_html = await page.content()
+                        
+                        # Store about page HTML in memory
+                        html_content['about_html'] = about_html
+                        
+                        # Save about page HTML only in debug mode
+                        if self.debug_mode and company_pages_dir:
+                            about_html_path = os.path.join(company_pages_dir, f'{company_name}_about.txt')
+                            await _save_debug_html(about_html_path, about_html)
+                    except Exception as e:
+                        logger.warning(f"Error navigating to About page: {e}")
+                
+                # Store the best HTML content for company info extraction
+                # Prioritize about page HTML if available, otherwise use main page.
+                # Either is shared with its own key rather than compressed again.
+                if about_html:
+                    html_content.alias('html', 'about_html')
+                else:
+                    html_content.alias('html', 'main_html')
+                    logger.warning(f"Using main company page for {company_name} as About page not available")
+                
+                logger.info(f"Company {i+1} HTML captured successfully")
+                
+                # Back off exponentially only while LinkedIn is rate limiting,
+                # and drop the delay again after a streak of clean loads
+                if rate_limited:
+                    self._clean_company_loads = 0
+                    self._company_backoff = min(
+                        max(self._company_backoff * 2, _MIN_COMPANY_BACKOFF), _MAX_COMPANY_BACKOFF
+                    )
+                    self._company_resume_at = max(
+                        self._company_resume_at, time.monotonic() + self._company_backoff
+                    )
+                    logger.warning(f"Rate limited on {rate_limited[0]}, backing off {self._company_backoff:.1f}s")
+                else:
+                    self._clean_company_loads += 1
+                    if self._clean_company_loads >= self._clean_loads_to_reset:
+                        self._company_backoff = 0.0
+            finally:
+                await page.close()
+        
+        # Cache only complete captures for later profiles, not rate-limit
+        # error pages or a main page standing in for a missing About page
+        if not rate_limited and about_html is not None:
+            now = time.monotonic()
+            # Evict every expired capture, so none outlives its TTL in memory
+            expired = [key for key, (captured_at, _) in self._company_cache.items()
+                       if now - captured_at >= cache_ttl]
+            for key in expired:
+                del self._company_cache[key]
+            self._company_cache[slug] = (now, html_content)
+        
+        return html_content
+    
+    async def _wait_out_rate_limit(self):
+        """Sleep until the shared rate-limit pause, if any, is over."""
+        delay = self._company_resume_at - time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            # Another task may have extended the pause meanwhile
+            delay = self._company_resume_at - time.monotonic()
+    
+    async def close(self):
+        """
+        Close the browser session opened by open() or scrape_profile, if any.
+        """
+        if self._session is None:
+            await self._stop_playwright()
+            return
+        browser, context, _ = self._session
+        self._session = None
+        try:
+            await context.close()
+        finally:
+            try:
+                await browser.close()
+            finally:
+                await self._stop_playwright()
+    
+    async def _stop_playwright(self):
+        """Stop the Playwright driver process started by open(), if any."""
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            await playwright.stop()
     
-    def get_html_content(self) -> Dict[str, str]:
+    def get_html_content(self) -> CompressedHTMLStore:
         """
         Get the HTML content stored in memory.
         
         Returns:
-            Dict[str, str]: Dictionary of HTML content with keys like 'profile_html', 
-                           '{section}_expanded_html', etc.
+            CompressedHTMLStore: Dict-like HTML content with keys like 'profile_html', 
+                           '{section}_expanded_html', '{section}_text', etc.
         """
         return self.html_content
\ No newline at end of file
@@ -1,4 +1,4 @@
-from bs4 import BeautifulSoup
+from .parsing import main_soup
 import json
 import os
 
@@ -19,7 +19,8 @@ class ProjectScraper:
         else:
             raise ValueError("Either html_file or html_content must be provided")
             
-        self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        # Only the Projects <main> element is built
+        self.soup = main_soup(self.html_content, 'Projects')
 
     def extract_projects(self):
         projects = []
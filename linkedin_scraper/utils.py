@@ -1,5 +1,4 @@
 import random
-import asyncio
 from typing import Tuple
 
 from playwright.async_api import Page
@@ -18,9 +17,9 @@ class RandomBehavior:
             text (str): Text to type
         """
         await page.focus(selector)
-        for char in text:
-            await page.type(selector, char, delay=random.uniform(50, 200))
-            await page.wait_for_timeout(random.uniform(50, 200))
+        # Playwright pauses for delay ms between keystrokes itself, so one call
+        # types the whole text without a round trip per character
+        await page.type(selector, text, delay=random.uniform(60, 140))
 
     @staticmethod
     async def simulate_scroll(page: Page):
@@ -8,8 +8,12 @@ setup(
     install_requires=[
         "aiohttp>=3.8.0",
         "beautifulsoup4>=4.9.0",
+        "soupsieve>=2.0",
+        "lxml>=4.6.0",
+        "selectolax>=0.3.12",
+        "orjson>=3.0.0",
         "python-dotenv>=0.19.0",
-        "playwright>=1.20.0",
+        "playwright>=1.33.0",
         "asyncio>=3.4.3",
     ],
     python_requires=">=3.7",